@@ -1,6 +1,13 @@
-from typing import Optional, Union
+from typing import Dict, Optional, Tuple, Union
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
+
+# Headers sent with every request. They are set on the HTTP clients, so that
+# only the Authorization header is passed per call.
+BASE_HEADERS: Dict[str, str] = {
+    "Content-Type": "application/json",
+    "Accept": "application/json",
+}
 
 
 class APIConfig(BaseModel):
@@ -10,12 +17,20 @@ class APIConfig(BaseModel):
     verify: Union[bool, str] = True
     access_token: Optional[str] = None
 
+    _headers_cache: Optional[Tuple[Optional[str], Dict[str, str]]] = PrivateAttr(default=None)
+
     def get_access_token(self) -> Optional[str]:
         return self.access_token
 
     def set_access_token(self, value: str):
         self.access_token = value
 
+    def cached_headers(self) -> Dict[str, str]:
+        token = self.get_access_token()
+        if self._headers_cache is None or self._headers_cache[0] != token:
+            self._headers_cache = (token, {"Authorization": f"Bearer { token }"})
+        return self._headers_cache[1]
+
 
 class HTTPException(Exception):
     def __init__(self, status_code: int, message: str):
@@ -12,7 +12,7 @@ class RideTagGetReturn(BaseModel):
 
     """
 
-    model_config = {"populate_by_name": True, "validate_assignment": True}
+    model_config = {"populate_by_name": True}
 
     link: RideTagLink = Field(validation_alias="link")
 
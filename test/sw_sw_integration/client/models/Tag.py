@@ -12,7 +12,7 @@ class Tag(BaseModel):
 
     """
 
-    model_config = {"populate_by_name": True, "validate_assignment": True}
+    model_config = {"populate_by_name": True}
 
     id: Optional[int] = Field(validation_alias="id", default=None)
 
@@ -0,0 +1,35 @@
+from typing import *
+
+import msgspec
+
+from .User import User
+
+
+class UserStruct(msgspec.Struct):
+    """
+    msgspec mirror of User, used to decode User responses
+
+    Fields missing from the response stay UNSET, so that they can be told apart from an explicit null.
+
+    """
+
+    id: Union[Optional[int], msgspec.UnsetType] = msgspec.UNSET
+
+    jwt_issuer: Union[Optional[str], msgspec.UnsetType] = msgspec.UNSET
+
+    jwt_subject: Union[Optional[str], msgspec.UnsetType] = msgspec.UNSET
+
+    name: Union[Optional[str], msgspec.UnsetType] = msgspec.UNSET
+
+
+_user_decoder = msgspec.json.Decoder(UserStruct)
+
+
+def load_user(body: bytes) -> User:
+    """Decode a User response body. msgspec type-checks the fields, so the User is built without validating them again."""
+    if body == b"null":
+        return User()
+    user = _user_decoder.decode(body)
+    fields = {name: getattr(user, name) for name in UserStruct.__struct_fields__}
+    # Pass only the fields present in the response, so model_fields_set matches a validated User.
+    return User.model_construct(**{name: value for name, value in fields.items() if value is not msgspec.UNSET})
@@ -9,7 +9,7 @@ class Value(BaseModel):
 
     """
 
-    model_config = {"populate_by_name": True, "validate_assignment": True}
+    model_config = {"populate_by_name": True}
 
     type: str
     value: Any
@@ -1,10 +1,18 @@
-import json
 from typing import *
 
-import httpx
+from pydantic import TypeAdapter
 
 from ..api_config import APIConfig, HTTPException
-from ..models import *
+from ..models.Ride import Ride
+from ..models.RideTagGetReturn import RideTagGetReturn
+from ..models.RideTagLink import RideTagLink
+from ._client import get_client as _get_client
+
+
+_ride_list_adapter: TypeAdapter[List[Ride]] = TypeAdapter(List[Ride])
+_ride_tag_get_return_list_adapter: TypeAdapter[List[RideTagGetReturn]] = TypeAdapter(List[RideTagGetReturn])
+_ride_to_json = Ride.__pydantic_serializer__.to_json
+_ride_tag_link_to_json = RideTagLink.__pydantic_serializer__.to_json
 
 
 def routes_ride_list(
@@ -12,98 +20,70 @@ def routes_ride_list(
 ) -> List[Ride]:
     api_config = api_config_override if api_config_override else APIConfig()
 
-    base_path = api_config.base_path
     path = f"/ride"
-    headers = {
-        "Content-Type": "application/json",
-        "Accept": "application/json",
-        "Authorization": f"Bearer { api_config.get_access_token() }",
-    }
+    headers = api_config.cached_headers()
     query_params: Dict[str, Any] = {"page": page, "size": size}
 
     query_params = {key: value for (key, value) in query_params.items() if value is not None}
 
-    with httpx.Client(base_url=base_path, verify=api_config.verify) as client:
-        response = client.request(
-            "get",
-            httpx.URL(path),
-            headers=headers,
-            params=query_params,
-        )
+    client = _get_client(api_config)
+    response = client.request(
+        "get",
+        path,
+        headers=headers,
+        params=query_params,
+    )
 
     if response.status_code != 200:
         raise HTTPException(response.status_code, f" failed with status code: {response.status_code}")
 
-    return [Ride(**item) for item in response.json()]
+    return _ride_list_adapter.validate_json(response.content)
 
 
 def routes_ride_post(data: Ride, api_config_override: Optional[APIConfig] = None) -> Ride:
     api_config = api_config_override if api_config_override else APIConfig()
 
-    base_path = api_config.base_path
     path = f"/ride"
-    headers = {
-        "Content-Type": "application/json",
-        "Accept": "application/json",
-        "Authorization": f"Bearer { api_config.get_access_token() }",
-    }
-    query_params: Dict[str, Any] = {}
-
-    query_params = {key: value for (key, value) in query_params.items() if value is not None}
+    headers = api_config.cached_headers()
 
-    with httpx.Client(base_url=base_path, verify=api_config.verify) as client:
-        response = client.request("post", httpx.URL(path), headers=headers, params=query_params, json=data.dict())
+    client = _get_client(api_config)
+    response = client.request("post", path, headers=headers, content=_ride_to_json(data, by_alias=True))
 
     if response.status_code != 200:
         raise HTTPException(response.status_code, f" failed with status code: {response.status_code}")
 
-    return Ride(**response.json()) if response.json() is not None else Ride()
+    body = response.content
+    return Ride.model_validate_json(body) if body != b"null" else Ride()
 
 
 def routes_ride_get(ride_id: int, api_config_override: Optional[APIConfig] = None) -> Ride:
     api_config = api_config_override if api_config_override else APIConfig()
 
-    base_path = api_config.base_path
     path = f"/ride/{ride_id}"
-    headers = {
-        "Content-Type": "application/json",
-        "Accept": "application/json",
-        "Authorization": f"Bearer { api_config.get_access_token() }",
-    }
-    query_params: Dict[str, Any] = {}
-
-    query_params = {key: value for (key, value) in query_params.items() if value is not None}
+    headers = api_config.cached_headers()
 
-    with httpx.Client(base_url=base_path, verify=api_config.verify) as client:
-        response = client.request(
-            "get",
-            httpx.URL(path),
-            headers=headers,
-            params=query_params,
-        )
+    client = _get_client(api_config)
+    response = client.request(
+        "get",
+        path,
+        headers=headers,
+    )
 
     if response.status_code != 200:
         raise HTTPException(response.status_code, f" failed with status code: {response.status_code}")
 
-    return Ride(**response.json()) if response.json() is not None else Ride()
+    body = response.content
+    return Ride.model_validate_json(body) if body != b"null" else Ride()
 
 
 def routes_ride_put(ride_id: int, data: Ride, api_config_override: Optional[APIConfig] = None) -> None:
     api_config = api_config_override if api_config_override else APIConfig()
 
-    base_path = api_config.base_path
     path = f"/ride/{ride_id}"
-    headers = {
-        "Content-Type": "application/json",
-        "Accept": "application/json",
-        "Authorization": f"Bearer { api_config.get_access_token() }",
-    }
-    query_params: Dict[str, Any] = {}
+    headers = api_config.cached_headers()
 
-    query_params = {key: value for (key, value) in query_params.items() if value is not None}
-
-    with httpx.Client(base_url=base_path, verify=api_config.verify) as client:
-        response = client.request("put", httpx.URL(path), headers=headers, params=query_params, json=data.dict())
+    client = _get_client(api_config)
+    response = client.request("put", path, headers=headers, content=_ride_to_json(data, by_alias=True))
 
     if response.status_code != 204:
         raise HTTPException(response.status_code, f" failed with status code: {response.status_code}")
@@ -114,24 +94,15 @@ def routes_ride_put(ride_id: int, data: Ride, api_config_override: Optional[APIC
 def routes_ride_delete(ride_id: int, api_config_override: Optional[APIConfig] = None) -> None:
     api_config = api_config_override if api_config_override else APIConfig()
 
-    base_path = api_config.base_path
     path = f"/ride/{ride_id}"
-    headers = {
-        "Content-Type": "application/json",
-        "Accept": "application/json",
-        "Authorization": f"Bearer { api_config.get_access_token() }",
-    }
-    query_params: Dict[str, Any] = {}
-
-    query_params = {key: value for (key, value) in query_params.items() if value is not None}
+    headers = api_config.cached_headers()
 
-    with httpx.Client(base_url=base_path, verify=api_config.verify) as client:
-        response = client.request(
-            "delete",
-            httpx.URL(path),
-            headers=headers,
-            params=query_params,
-        )
+    client = _get_client(api_config)
+    response = client.request(
+        "delete",
+        path,
+        headers=headers,
+    )
 
     if response.status_code != 204:
         raise HTTPException(response.status_code, f" failed with status code: {response.status_code}")
@@ -142,29 +113,20 @@ def routes_ride_delete(ride_id: int, api_config_override: Optional[APIConfig] =
 def routes_ride_tag_list(ride_id: int, api_config_override: Optional[APIConfig] = None) -> List[RideTagGetReturn]:
     api_config = api_config_override if api_config_override else APIConfig()
 
-    base_path = api_config.base_path
     path = f"/ride/{ride_id}/ride_tags"
-    headers = {
-        "Content-Type": "application/json",
-        "Accept": "application/json",
-        "Authorization": f"Bearer { api_config.get_access_token() }",
-    }
-    query_params: Dict[str, Any] = {}
-
-    query_params = {key: value for (key, value) in query_params.items() if value is not None}
+    headers = api_config.cached_headers()
 
-    with httpx.Client(base_url=base_path, verify=api_config.verify) as client:
-        response = client.request(
-            "get",
-            httpx.URL(path),
-            headers=headers,
-            params=query_params,
-        )
+    client = _get_client(api_config)
+    response = client.request(
+        "get",
+        path,
+        headers=headers,
+    )
 
     if response.status_code != 200:
         raise HTTPException(response.status_code, f" failed with status code: {response.status_code}")
 
-    return [RideTagGetReturn(**item) for item in response.json()]
+    return _ride_tag_get_return_list_adapter.validate_json(response.content)
 
 
 def routes_ride_tag_get_by_tag_id(
@@ -172,29 +134,21 @@ def routes_ride_tag_get_by_tag_id(
 ) -> RideTagGetReturn:
     api_config = api_config_override if api_config_override else APIConfig()
 
-    base_path = api_config.base_path
     path = f"/ride/{ride_id}/ride_tags/{tag_id}"
-    headers = {
-        "Content-Type": "application/json",
-        "Accept": "application/json",
-        "Authorization": f"Bearer { api_config.get_access_token() }",
-    }
-    query_params: Dict[str, Any] = {}
+    headers = api_config.cached_headers()
 
-    query_params = {key: value for (key, value) in query_params.items() if value is not None}
-
-    with httpx.Client(base_url=base_path, verify=api_config.verify) as client:
-        response = client.request(
-            "get",
-            httpx.URL(path),
-            headers=headers,
-            params=query_params,
-        )
+    client = _get_client(api_config)
+    response = client.request(
+        "get",
+        path,
+        headers=headers,
+    )
 
     if response.status_code != 200:
         raise HTTPException(response.status_code, f" failed with status code: {response.status_code}")
 
-    return RideTagGetReturn(**response.json()) if response.json() is not None else RideTagGetReturn()
+    body = response.content
+    return RideTagGetReturn.model_validate_json(body) if body != b"null" else RideTagGetReturn()
 
 
 def routes_ride_tag_post_by_tag_id(
@@ -202,70 +156,47 @@ def routes_ride_tag_post_by_tag_id(
 ) -> RideTagLink:
     api_config = api_config_override if api_config_override else APIConfig()
 
-    base_path = api_config.base_path
     path = f"/ride/{ride_id}/ride_tags/{tag_id}"
-    headers = {
-        "Content-Type": "application/json",
-        "Accept": "application/json",
-        "Authorization": f"Bearer { api_config.get_access_token() }",
-    }
-    query_params: Dict[str, Any] = {}
-
-    query_params = {key: value for (key, value) in query_params.items() if value is not None}
+    headers = api_config.cached_headers()
 
-    with httpx.Client(base_url=base_path, verify=api_config.verify) as client:
-        response = client.request("post", httpx.URL(path), headers=headers, params=query_params, json=data.dict())
+    client = _get_client(api_config)
+    response = client.request("post", path, headers=headers, content=_ride_tag_link_to_json(data, by_alias=True))
 
     if response.status_code != 200:
         raise HTTPException(response.status_code, f" failed with status code: {response.status_code}")
 
-    return RideTagLink(**response.json()) if response.json() is not None else RideTagLink()
+    body = response.content
+    return RideTagLink.model_validate_json(body) if body != b"null" else RideTagLink()
 
 
 def routes_ride_tag_get_by_link_id(link_id: int, api_config_override: Optional[APIConfig] = None) -> RideTagGetReturn:
     api_config = api_config_override if api_config_override else APIConfig()
 
-    base_path = api_config.base_path
     path = f"/ride_tag/{link_id}"
-    headers = {
-        "Content-Type": "application/json",
-        "Accept": "application/json",
-        "Authorization": f"Bearer { api_config.get_access_token() }",
-    }
-    query_params: Dict[str, Any] = {}
-
-    query_params = {key: value for (key, value) in query_params.items() if value is not None}
+    headers = api_config.cached_headers()
 
-    with httpx.Client(base_url=base_path, verify=api_config.verify) as client:
-        response = client.request(
-            "get",
-            httpx.URL(path),
-            headers=headers,
-            params=query_params,
-        )
+    client = _get_client(api_config)
+    response = client.request(
+        "get",
+        path,
+        headers=headers,
+    )
 
     if response.status_code != 200:
         raise HTTPException(response.status_code, f" failed with status code: {response.status_code}")
 
-    return RideTagGetReturn(**response.json()) if response.json() is not None else RideTagGetReturn()
+    body = response.content
+    return RideTagGetReturn.model_validate_json(body) if body != b"null" else RideTagGetReturn()
 
 
 def routes_ride_tag_put(link_id: int, data: RideTagLink, api_config_override: Optional[APIConfig] = None) -> None:
     api_config = api_config_override if api_config_override else APIConfig()
 
-    base_path = api_config.base_path
     path = f"/ride_tag/{link_id}"
-    headers = {
-        "Content-Type": "application/json",
-        "Accept": "application/json",
-        "Authorization": f"Bearer { api_config.get_access_token() }",
-    }
-    query_params: Dict[str, Any] = {}
+    headers = api_config.cached_headers()
 
-    query_params = {key: value for (key, value) in query_params.items() if value is not None}
-
-    with httpx.Client(base_url=base_path, verify=api_config.verify) as client:
-        response = client.request("put", httpx.URL(path), headers=headers, params=query_params, json=data.dict())
+    client = _get_client(api_config)
+    response = client.request("put", path, headers=headers, content=_ride_tag_link_to_json(data, by_alias=True))
 
     if response.status_code != 204:
         raise HTTPException(response.status_code, f" failed with status code: {response.status_code}")
@@ -276,24 +207,15 @@ def routes_ride_tag_put(link_id: int, data: RideTagLink, api_config_override: Op
 def routes_ride_tag_delete(link_id: int, api_config_override: Optional[APIConfig] = None) -> None:
     api_config = api_config_override if api_config_override else APIConfig()
 
-    base_path = api_config.base_path
     path = f"/ride_tag/{link_id}"
-    headers = {
-        "Content-Type": "application/json",
-        "Accept": "application/json",
-        "Authorization": f"Bearer { api_config.get_access_token() }",
-    }
-    query_params: Dict[str, Any] = {}
-
-    query_params = {key: value for (key, value) in query_params.items() if value is not None}
-
-    with httpx.Client(base_url=base_path, verify=api_config.verify) as client:
-        response = client.request(
-            "delete",
-            httpx.URL(path),
-            headers=headers,
-            params=query_params,
-        )
+    headers = api_config.cached_headers()
+
+    client = _get_client(api_config)
+    response = client.request(
+        "delete",
+        path,
+        headers=headers,
+    )
 
     if response.status_code != 204:
         raise HTTPException(response.status_code, f" failed with status code: {response.status_code}")
@@ -1,58 +1,43 @@
-import json
 from typing import *
 
-import httpx
-
 from ..api_config import APIConfig, HTTPException
-from ..models import *
+from ..models.User import User
+from ..models.UserStruct import load_user
+from ._client import get_client as _get_client
+
+
+_user_to_json = User.__pydantic_serializer__.to_json
 
 
 def routes_user_get(api_config_override: Optional[APIConfig] = None) -> User:
     api_config = api_config_override if api_config_override else APIConfig()
 
-    base_path = api_config.base_path
     path = f"/user"
-    headers = {
-        "Content-Type": "application/json",
-        "Accept": "application/json",
-        "Authorization": f"Bearer { api_config.get_access_token() }",
-    }
-    query_params: Dict[str, Any] = {}
-
-    query_params = {key: value for (key, value) in query_params.items() if value is not None}
-
-    with httpx.Client(base_url=base_path, verify=api_config.verify) as client:
-        response = client.request(
-            "get",
-            httpx.URL(path),
-            headers=headers,
-            params=query_params,
-        )
+    headers = api_config.cached_headers()
+
+    client = _get_client(api_config)
+    response = client.request(
+        "get",
+        path,
+        headers=headers,
+    )
 
     if response.status_code != 200:
         raise HTTPException(response.status_code, f" failed with status code: {response.status_code}")
 
-    return User(**response.json()) if response.json() is not None else User()
+    return load_user(response.content)
 
 
 def routes_user_put(data: User, api_config_override: Optional[APIConfig] = None) -> User:
     api_config = api_config_override if api_config_override else APIConfig()
 
-    base_path = api_config.base_path
     path = f"/user"
-    headers = {
-        "Content-Type": "application/json",
-        "Accept": "application/json",
-        "Authorization": f"Bearer { api_config.get_access_token() }",
-    }
-    query_params: Dict[str, Any] = {}
-
-    query_params = {key: value for (key, value) in query_params.items() if value is not None}
+    headers = api_config.cached_headers()
 
-    with httpx.Client(base_url=base_path, verify=api_config.verify) as client:
-        response = client.request("put", httpx.URL(path), headers=headers, params=query_params, json=data.dict())
+    client = _get_client(api_config)
+    response = client.request("put", path, headers=headers, content=_user_to_json(data, by_alias=True))
 
     if response.status_code != 200:
         raise HTTPException(response.status_code, f" failed with status code: {response.status_code}")
 
-    return User(**response.json()) if response.json() is not None else User()
+    return load_user(response.content)
@@ -0,0 +1,44 @@
+import asyncio
+import weakref
+from typing import *
+
+from ..api_config import BASE_HEADERS, APIConfig
+
+# httpx is only imported once a request is made, so importing the services
+# for their signatures does not pull in the HTTP stack.
+if TYPE_CHECKING:
+    import httpx
+
+
+# httpx.AsyncClient is bound to the event loop it was first used on, so the
+# pooled clients are kept per running loop and shared by all async services.
+_ClientKey = Tuple[str, Union[bool, str]]
+
+_client_cache: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[_ClientKey, httpx.AsyncClient]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_client(api_config: APIConfig) -> "httpx.AsyncClient":
+    clients = _client_cache.setdefault(asyncio.get_running_loop(), {})
+    key = (api_config.base_path, api_config.verify)
+    client = clients.get(key)
+    if client is None:
+        import httpx
+
+        client = httpx.AsyncClient(
+            base_url=api_config.base_path,
+            verify=api_config.verify,
+            headers=BASE_HEADERS,
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=32),
+        )
+        clients[key] = client
+    return client
+
+
+async def close_client() -> None:
+    """Close the pooled clients of the running event loop. Must be awaited before that loop is closed."""
+    clients = _client_cache.pop(asyncio.get_running_loop(), {})
+    for client in clients.values():
+        await client.aclose()
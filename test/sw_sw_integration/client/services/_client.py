@@ -0,0 +1,41 @@
+import atexit
+from typing import *
+
+from ..api_config import BASE_HEADERS, APIConfig
+
+# httpx is only imported once a request is made, so importing the services
+# for their signatures does not pull in the HTTP stack.
+if TYPE_CHECKING:
+    import httpx
+
+
+# One pooled client per server, shared by all sync services, so that
+# consecutive calls reuse their connections.
+_ClientKey = Tuple[str, Union[bool, str]]
+
+_client_cache: Dict[_ClientKey, "httpx.Client"] = {}
+
+
+def get_client(api_config: APIConfig) -> "httpx.Client":
+    key = (api_config.base_path, api_config.verify)
+    client = _client_cache.get(key)
+    if client is None:
+        import httpx
+
+        client = httpx.Client(
+            base_url=api_config.base_path,
+            verify=api_config.verify,
+            headers=BASE_HEADERS,
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=32),
+        )
+        _client_cache[key] = client
+    return client
+
+
+@atexit.register
+def close_client() -> None:
+    """Close the pooled clients."""
+    for client in _client_cache.values():
+        client.close()
+    _client_cache.clear()
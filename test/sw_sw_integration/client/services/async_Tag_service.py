@@ -1,107 +1,82 @@
-import json
 from typing import *
 
-import httpx
+from pydantic import TypeAdapter
 
 from ..api_config import APIConfig, HTTPException
-from ..models import *
+from ..models.Tag import Tag
+from ..models.TagOption import TagOption
+from ._async_client import get_client as _get_client
+
+
+_tag_list_adapter: TypeAdapter[List[Tag]] = TypeAdapter(List[Tag])
+_tag_option_list_adapter: TypeAdapter[List[TagOption]] = TypeAdapter(List[TagOption])
+_tag_to_json = Tag.__pydantic_serializer__.to_json
+_tag_option_to_json = TagOption.__pydantic_serializer__.to_json
 
 
 async def routes_tag_list(api_config_override: Optional[APIConfig] = None) -> List[Tag]:
     api_config = api_config_override if api_config_override else APIConfig()
 
-    base_path = api_config.base_path
     path = f"/tag"
-    headers = {
-        "Content-Type": "application/json",
-        "Accept": "application/json",
-        "Authorization": f"Bearer { api_config.get_access_token() }",
-    }
-    query_params: Dict[str, Any] = {}
-
-    query_params = {key: value for (key, value) in query_params.items() if value is not None}
-
-    async with httpx.AsyncClient(base_url=base_path, verify=api_config.verify) as client:
-        response = await client.request(
-            "get",
-            httpx.URL(path),
-            headers=headers,
-            params=query_params,
-        )
+    headers = api_config.cached_headers()
+
+    client = _get_client(api_config)
+    response = await client.request(
+        "get",
+        path,
+        headers=headers,
+    )
 
     if response.status_code != 200:
         raise HTTPException(response.status_code, f" failed with status code: {response.status_code}")
 
-    return [Tag(**item) for item in response.json()]
+    return _tag_list_adapter.validate_json(response.content)
 
 
 async def routes_tag_post(data: Tag, api_config_override: Optional[APIConfig] = None) -> Tag:
     api_config = api_config_override if api_config_override else APIConfig()
 
-    base_path = api_config.base_path
     path = f"/tag"
-    headers = {
-        "Content-Type": "application/json",
-        "Accept": "application/json",
-        "Authorization": f"Bearer { api_config.get_access_token() }",
-    }
-    query_params: Dict[str, Any] = {}
+    headers = api_config.cached_headers()
 
-    query_params = {key: value for (key, value) in query_params.items() if value is not None}
-
-    async with httpx.AsyncClient(base_url=base_path, verify=api_config.verify) as client:
-        response = await client.request("post", httpx.URL(path), headers=headers, params=query_params, json=data.dict())
+    client = _get_client(api_config)
+    response = await client.request("post", path, headers=headers, content=_tag_to_json(data, by_alias=True))
 
     if response.status_code != 200:
         raise HTTPException(response.status_code, f" failed with status code: {response.status_code}")
 
-    return Tag(**response.json()) if response.json() is not None else Tag()
+    body = response.content
+    return Tag.model_validate_json(body) if body != b"null" else Tag()
 
 
 async def routes_tag_get(tag_id: int, api_config_override: Optional[APIConfig] = None) -> Tag:
     api_config = api_config_override if api_config_override else APIConfig()
 
-    base_path = api_config.base_path
     path = f"/tag/{tag_id}"
-    headers = {
-        "Content-Type": "application/json",
-        "Accept": "application/json",
-        "Authorization": f"Bearer { api_config.get_access_token() }",
-    }
-    query_params: Dict[str, Any] = {}
-
-    query_params = {key: value for (key, value) in query_params.items() if value is not None}
-
-    async with httpx.AsyncClient(base_url=base_path, verify=api_config.verify) as client:
-        response = await client.request(
-            "get",
-            httpx.URL(path),
-            headers=headers,
-            params=query_params,
-        )
+    headers = api_config.cached_headers()
+
+    client = _get_client(api_config)
+    response = await client.request(
+        "get",
+        path,
+        headers=headers,
+    )
 
     if response.status_code != 200:
         raise HTTPException(response.status_code, f" failed with status code: {response.status_code}")
 
-    return Tag(**response.json()) if response.json() is not None else Tag()
+    body = response.content
+    return Tag.model_validate_json(body) if body != b"null" else Tag()
 
 
 async def routes_tag_put(tag_id: int, data: Tag, api_config_override: Optional[APIConfig] = None) -> None:
     api_config = api_config_override if api_config_override else APIConfig()
 
-    base_path = api_config.base_path
     path = f"/tag/{tag_id}"
-    headers = {
-        "Content-Type": "application/json",
-        "Accept": "application/json",
-        "Authorization": f"Bearer { api_config.get_access_token() }",
-    }
-    query_params: Dict[str, Any] = {}
-
-    query_params = {key: value for (key, value) in query_params.items() if value is not None}
+    headers = api_config.cached_headers()
 
-    async with httpx.AsyncClient(base_url=base_path, verify=api_config.verify) as client:
-        response = await client.request("put", httpx.URL(path), headers=headers, params=query_params, json=data.dict())
+    client = _get_client(api_config)
+    response = await client.request("put", path, headers=headers, content=_tag_to_json(data, by_alias=True))
 
     if response.status_code != 204:
         raise HTTPException(response.status_code, f" failed with status code: {response.status_code}")
@@ -112,24 +87,15 @@ async def routes_tag_put(tag_id: int, data: Tag, api_config_override: Optional[A
 async def routes_tag_delete(tag_id: int, api_config_override: Optional[APIConfig] = None) -> None:
     api_config = api_config_override if api_config_override else APIConfig()
 
-    base_path = api_config.base_path
     path = f"/tag/{tag_id}"
-    headers = {
-        "Content-Type": "application/json",
-        "Accept": "application/json",
-        "Authorization": f"Bearer { api_config.get_access_token() }",
-    }
-    query_params: Dict[str, Any] = {}
-
-    query_params = {key: value for (key, value) in query_params.items() if value is not None}
-
-    async with httpx.AsyncClient(base_url=base_path, verify=api_config.verify) as client:
-        response = await client.request(
-            "delete",
-            httpx.URL(path),
-            headers=headers,
-            params=query_params,
-        )
+    headers = api_config.cached_headers()
+
+    client = _get_client(api_config)
+    response = await client.request(
+        "delete",
+        path,
+        headers=headers,
+    )
 
     if response.status_code != 204:
         raise HTTPException(response.status_code, f" failed with status code: {response.status_code}")
@@ -140,29 +106,20 @@ async def routes_tag_delete(tag_id: int, api_config_override: Optional[APIConfig
 async def routes_tag_option_list(tag_id: int, api_config_override: Optional[APIConfig] = None) -> List[TagOption]:
     api_config = api_config_override if api_config_override else APIConfig()
 
-    base_path = api_config.base_path
     path = f"/tag/{tag_id}/tag_option"
-    headers = {
-        "Content-Type": "application/json",
-        "Accept": "application/json",
-        "Authorization": f"Bearer { api_config.get_access_token() }",
-    }
-    query_params: Dict[str, Any] = {}
-
-    query_params = {key: value for (key, value) in query_params.items() if value is not None}
-
-    async with httpx.AsyncClient(base_url=base_path, verify=api_config.verify) as client:
-        response = await client.request(
-            "get",
-            httpx.URL(path),
-            headers=headers,
-            params=query_params,
-        )
+    headers = api_config.cached_headers()
+
+    client = _get_client(api_config)
+    response = await client.request(
+        "get",
+        path,
+        headers=headers,
+    )
 
     if response.status_code != 200:
         raise HTTPException(response.status_code, f" failed with status code: {response.status_code}")
 
-    return [TagOption(**item) for item in response.json()]
+    return _tag_option_list_adapter.validate_json(response.content)
 
 
 async def routes_tag_option_post(
@@ -170,52 +127,37 @@ async def routes_tag_option_post(
 ) -> TagOption:
     api_config = api_config_override if api_config_override else APIConfig()
 
-    base_path = api_config.base_path
     path = f"/tag/{tag_id}/tag_option"
-    headers = {
-        "Content-Type": "application/json",
-        "Accept": "application/json",
-        "Authorization": f"Bearer { api_config.get_access_token() }",
-    }
-    query_params: Dict[str, Any] = {}
-
-    query_params = {key: value for (key, value) in query_params.items() if value is not None}
+    headers = api_config.cached_headers()
 
-    async with httpx.AsyncClient(base_url=base_path, verify=api_config.verify) as client:
-        response = await client.request("post", httpx.URL(path), headers=headers, params=query_params, json=data.dict())
+    client = _get_client(api_config)
+    response = await client.request("post", path, headers=headers, content=_tag_option_to_json(data, by_alias=True))
 
     if response.status_code != 200:
         raise HTTPException(response.status_code, f" failed with status code: {response.status_code}")
 
-    return TagOption(**response.json()) if response.json() is not None else TagOption()
+    body = response.content
+    return TagOption.model_validate_json(body) if body != b"null" else TagOption()
 
 
 async def routes_tag_option_get(option_id: int, api_config_override: Optional[APIConfig] = None) -> TagOption:
     api_config = api_config_override if api_config_override else APIConfig()
 
-    base_path = api_config.base_path
     path = f"/tag_option/{option_id}"
-    headers = {
-        "Content-Type": "application/json",
-        "Accept": "application/json",
-        "Authorization": f"Bearer { api_config.get_access_token() }",
-    }
-    query_params: Dict[str, Any] = {}
-
-    query_params = {key: value for (key, value) in query_params.items() if value is not None}
-
-    async with httpx.AsyncClient(base_url=base_path, verify=api_config.verify) as client:
-        response = await client.request(
-            "get",
-            httpx.URL(path),
-            headers=headers,
-            params=query_params,
-        )
+    headers = api_config.cached_headers()
+
+    client = _get_client(api_config)
+    response = await client.request(
+        "get",
+        path,
+        headers=headers,
+    )
 
     if response.status_code != 200:
         raise HTTPException(response.status_code, f" failed with status code: {response.status_code}")
 
-    return TagOption(**response.json()) if response.json() is not None else TagOption()
+    body = response.content
+    return TagOption.model_validate_json(body) if body != b"null" else TagOption()
 
 
 async def routes_tag_option_put(
@@ -223,19 +165,11 @@ async def routes_tag_option_put(
 ) -> None:
     api_config = api_config_override if api_config_override else APIConfig()
 
-    base_path = api_config.base_path
     path = f"/tag_option/{option_id}"
-    headers = {
-        "Content-Type": "application/json",
-        "Accept": "application/json",
-        "Authorization": f"Bearer { api_config.get_access_token() }",
-    }
-    query_params: Dict[str, Any] = {}
-
-    query_params = {key: value for (key, value) in query_params.items() if value is not None}
+    headers = api_config.cached_headers()
 
-    async with httpx.AsyncClient(base_url=base_path, verify=api_config.verify) as client:
-        response = await client.request("put", httpx.URL(path), headers=headers, params=query_params, json=data.dict())
+    client = _get_client(api_config)
+    response = await client.request("put", path, headers=headers, content=_tag_option_to_json(data, by_alias=True))
 
     if response.status_code != 204:
         raise HTTPException(response.status_code, f" failed with status code: {response.status_code}")
@@ -246,24 +180,15 @@ async def routes_tag_option_put(
 async def routes_tag_option_delete(option_id: int, api_config_override: Optional[APIConfig] = None) -> None:
     api_config = api_config_override if api_config_override else APIConfig()
 
-    base_path = api_config.base_path
     path = f"/tag_option/{option_id}"
-    headers = {
-        "Content-Type": "application/json",
-        "Accept": "application/json",
-        "Authorization": f"Bearer { api_config.get_access_token() }",
-    }
-    query_params: Dict[str, Any] = {}
-
-    query_params = {key: value for (key, value) in query_params.items() if value is not None}
-
-    async with httpx.AsyncClient(base_url=base_path, verify=api_config.verify) as client:
-        response = await client.request(
-            "delete",
-            httpx.URL(path),
-            headers=headers,
-            params=query_params,
-        )
+    headers = api_config.cached_headers()
+
+    client = _get_client(api_config)
+    response = await client.request(
+        "delete",
+        path,
+        headers=headers,
+    )
 
     if response.status_code != 204:
         raise HTTPException(response.status_code, f" failed with status code: {response.status_code}")
@@ -0,0 +1,9 @@
+# SPDX-License-Identifier: MPL-2.0
+#   Copyright (c) 2025 Philipp Le <philipp@philipple.de>.
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+# Register the server fixtures once for the whole directory. Importing them into every
+# test module would give each module its own copy of the session-scoped server.
+pytest_plugins = ["server_fixtures"]
@@ -5,20 +5,25 @@
 # file, You can obtain one at https://mozilla.org/MPL/2.0/.
 
 import httpx
+import json
 import os
 import pytest
+import pytest_asyncio
 import select
 import signal
+import sqlite3
 import sys
 import time
+from contextlib import closing
 from pathlib import Path
 from tempfile import TemporaryDirectory
 from subprocess import Popen, PIPE
 
-from client.api_config import APIConfig
+from client.api_config import APIConfig, HTTPException
+from client.services._async_client import close_client
 
 
-def create_token(tmpdir: Path, key_id: str, subject: str, write: bool):
+def token_args(key_id: str, subject: str, write: bool):
     token_manager_path = (Path(__file__).parent.parent.parent / "jwt_auth" / "target" / "debug" / "token")
     token_manager_base_args = [
         str(token_manager_path),
@@ -36,19 +41,91 @@ def create_token(tmpdir: Path, key_id: str, subject: str, write: bool):
         token_manager_base_args.append("--claims-json")
         token_manager_base_args.append("{\"ptet:write\":true}")
     token_manager_base_args.append(subject)
-    with Popen(
-            token_manager_base_args,
+    return token_manager_base_args
+
+
+def create_tokens(tmpdir: Path, key_id: str, requests: list[tuple[str, bool]]):
+    """Create one token per (subject, write) pair. All token processes are started before the first one is read."""
+    procs = [
+        Popen(
+            token_args(key_id, subject, write),
             cwd=str(tmpdir.absolute()),
             stdout=PIPE,
             stderr=PIPE,
-            preexec_fn=os.setsid,
-    ) as proc:
-        token = proc.stdout.readline().decode().strip()
-    return token
+            start_new_session=True,
+        )
+        for subject, write in requests
+    ]
+    tokens = []
+    try:
+        for proc in procs:
+            # communicate() drains stderr as well, so a chatty token process cannot block on a full pipe
+            out, _ = proc.communicate(timeout=10)
+            tokens.append(out.split(b"\n", 1)[0].decode().strip())
+    except BaseException:
+        # The processes run in their own session, so Ctrl-C does not reach them. Kill and reap them here.
+        for proc in procs:
+            if proc.poll() is None:
+                proc.kill()
+            proc.communicate()
+        raise
+    return tokens
+
+
+def dut_port():
+    """Port of this process' server. Every pytest-xdist worker starts its own server and database."""
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+    return 8000 + int(worker.removeprefix("gw"))
+
+
+# Token subject and write claim of every role the tests act as. The unauthorized role has no token.
+ROLES = {
+    "read": ("test1@example.tld", False),
+    "read_write": ("test1@example.tld", True),
+    "unauthorized": None,
+    "read_2": ("test2@example.tld", False),
+    "read_write_2": ("test2@example.tld", True),
+}
+
+
+# Tables cleared before every test, children first. The user table is kept,
+# because the server caches the user ID of each token subject.
+DATA_TABLES = ("ride_tag", "tag_enum_option", "ride", "tag_descriptor")
+_PLACEHOLDERS = ", ".join("?" * len(DATA_TABLES))
+
+
+def clean_tables(db_path: Path):
+    """Delete all rows from the data tables and reset their ID counters."""
+    with closing(sqlite3.connect(db_path, timeout=10.0)) as db:
+        # Every insert creates or bumps the table's ID counter. Without any counter, nothing
+        # has been written since the last cleanup and the tables are still empty.
+        written = db.execute(f"SELECT 1 FROM sqlite_sequence WHERE name IN ({_PLACEHOLDERS}) LIMIT 1", DATA_TABLES)
+        if written.fetchone() is None:
+            return
+        with db:
+            for table in DATA_TABLES:
+                db.execute(f"DELETE FROM {table}")
+            db.execute(f"DELETE FROM sqlite_sequence WHERE name IN ({_PLACEHOLDERS})", DATA_TABLES)
+
+
+# Every test starts with empty tables and creates only a few rows, so no row has this ID.
+# It still fits the u32 IDs of the server's routes.
+MISSING_ID = 999_999_999
+
+
+def assert_http_status(status_code: int, call, *args, **kwargs) -> HTTPException:
+    """Call a route and check that it fails with the given status code. Returns the raised exception."""
+    try:
+        call(*args, **kwargs)
+    except HTTPException as exc:
+        assert exc.status_code == status_code
+        return exc
+    pytest.fail(f"expected HTTPException {status_code}")
 
 
-@pytest.fixture
-def dut():
+@pytest.fixture(scope="session")
+def dut_process():
+    """Start the server on a fresh database. Use dut, which waits until the server is up."""
     with TemporaryDirectory() as tmpdir:
         tmpdir = Path(tmpdir)
 
@@ -102,91 +179,114 @@ def dut():
         )
 
         # Start server
+        # The server outlives many tests, so its log goes to a file instead of a pipe nobody reads,
+        # which would eventually fill up and block the server.
         dut_path = (Path(__file__).parent.parent.parent / "target" / "debug" / "public-transport-expense-tracker")
+        db_path = (tmpdir / "db.sqlite3").absolute()
+        log_file = (tmpdir / "dut.log").open("wb")
+        port = dut_port()
         dut = Popen(
             [
                 str(dut_path),
                 "--database",
-                f"sqlite://{(tmpdir / "db.sqlite3").absolute()}?mode=rwc",
+                f"sqlite://{db_path}?mode=rwc",
                 "--keys-dir",
                 str(keys_root.absolute()),
                 "-u",
                 "http://localhost:8000",
             ],
             cwd=str(tmpdir.absolute()),
-            stdout=PIPE,
-            stderr=PIPE,
-            preexec_fn=os.setsid,
+            env={**os.environ, "ROCKET_PORT": str(port)},
+            stdout=log_file,
+            stderr=log_file,
+            start_new_session=True,
         )
 
-        # Create access tokens for User 1
-        read_token_1 = create_token(tmpdir, key_id, "test1@example.tld", False)
-        write_token_1 = create_token(tmpdir, key_id, "test1@example.tld", True)
-
-        # Create access tokens for User 2
-        read_token_2 = create_token(tmpdir, key_id, "test2@example.tld", False)
-        write_token_2 = create_token(tmpdir, key_id, "test2@example.tld", True)
-
-        # Wait for heartbeat
-        base_url = "http://localhost:8000/api/v1"
-        with httpx.Client(base_url=base_url, verify=True) as client:
-            for step in range(10):
-                try:
-                    response = client.get("/openapi.json")
-                    if response.status_code == 200:
-                        break
-                except:
-                    pass
-                time.sleep(1.0)
-
         yield {
-            "base_url": base_url,
-            "read_token_1": read_token_1,
-            "write_token_1": write_token_1,
-            "read_token_2": read_token_2,
-            "write_token_2": write_token_2,
+            "base_url": f"http://localhost:{port}/api/v1",
+            "db_path": db_path,
+            "work_dir": tmpdir,
+            "key_id": key_id,
         }
 
         pgid = os.getpgid(dut.pid)
         os.killpg(pgid, signal.SIGTERM)
         dut.wait()
+        log_file.close()
+
+
+@pytest.fixture(scope="session")
+def auth_tokens(dut_process, tmp_path_factory):
+    """Access token per authorized role.
+
+    All servers of a run share the same signing key, so the pytest-xdist workers share one set of tokens.
+    The first worker to get here creates them, the others read them from the run's common temporary directory.
+    """
+    shared_dir = tmp_path_factory.getbasetemp()
+    if "PYTEST_XDIST_WORKER" in os.environ:
+        shared_dir = shared_dir.parent
+    cache = shared_dir / "auth_tokens.json"
+    if cache.exists():
+        return json.loads(cache.read_text())
+
+    authorized_roles = [role for role, grant in ROLES.items() if grant is not None]
+    tokens = dict(zip(
+        authorized_roles,
+        create_tokens(dut_process["work_dir"], dut_process["key_id"], [ROLES[role] for role in authorized_roles]),
+    ))
+    # Replace the cache in one step, so that no worker reads a half-written file
+    partial = cache.with_name(f"{cache.name}.{os.getpid()}")
+    partial.write_text(json.dumps(tokens))
+    partial.replace(cache)
+    return tokens
+
 
+@pytest.fixture(scope="session")
+def dut(dut_process, auth_tokens):
+    """The running server. The tokens are requested first, so that they are created while the server starts up."""
+    # Wait for heartbeat
+    with httpx.Client(base_url=dut_process["base_url"], verify=True) as client:
+        for step in range(10):
+            try:
+                response = client.get("/openapi.json")
+                if response.status_code == 200:
+                    break
+            except:
+                pass
+            time.sleep(1.0)
 
-@pytest.fixture
-def api_config_dict(dut):
-    return {
-        "read": APIConfig(
-            base_path=dut["base_url"],
-            access_token=dut["read_token_1"],
-        ),
-        "read_write": APIConfig(
-            base_path=dut["base_url"],
-            access_token=dut["write_token_1"],
-        ),
-        "unauthorized": APIConfig(
-            base_path=dut["base_url"],
-        ),
-        "read_2": APIConfig(
-            base_path=dut["base_url"],
-            access_token=dut["read_token_2"],
-        ),
-        "read_write_2": APIConfig(
-            base_path=dut["base_url"],
-            access_token=dut["write_token_2"],
-        ),
-    }
-
-
-@pytest.fixture
+    return dut_process
+
+
+@pytest.fixture(autouse=True)
+def clean_db(dut):
+    """Empty the data tables and reset their ID counters, so that every test starts on an empty database."""
+    clean_tables(dut["db_path"])
+
+
+@pytest.fixture(scope="session")
+def api_config_dict(dut, auth_tokens):
+    """API configuration per role. They only wrap the session's tokens, so they are built once."""
+    return {role: APIConfig(base_path=dut["base_url"], access_token=auth_tokens.get(role)) for role in ROLES}
+
+
+@pytest.fixture(scope="session")
 def api_config_unauthorized(api_config_dict):
     return api_config_dict["unauthorized"]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def api_config_read(api_config_dict):
     return api_config_dict["read"]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def api_config_readwrite(api_config_dict):
     return api_config_dict["read_write"]
+
+
+@pytest_asyncio.fixture
+async def async_client():
+    """Close the AsyncClient shared by the async services before the test's event loop goes away."""
+    yield
+    await close_client()
@@ -4,29 +4,41 @@
 # License, v. 2.0. If a copy of the MPL was not distributed with this
 # file, You can obtain one at https://mozilla.org/MPL/2.0/.
 
+import asyncio
 import pytest
 
-from client.services.Ride_service import *
-from server_fixtures import *
+from client.models.Ride import Ride
+from client.services.Ride_service import (
+    routes_ride_delete,
+    routes_ride_get,
+    routes_ride_list,
+    routes_ride_post,
+    routes_ride_put,
+)
+from client.services.async_Ride_service import routes_ride_post as routes_ride_post_async
+from server_fixtures import assert_http_status
 
 
-@pytest.fixture
+pytestmark = pytest.mark.xdist_group(name="test_ride")
+
+
+@pytest.fixture(scope="module")
 def sample_rides():
-    return [
-        Ride(
+    return (
+        Ride.model_construct(
             journey_departure="2025-03-01T15:15:00Z",
             location_from="Berlin",
             location_to="Hamburg",
             is_template=False,
         ),
-        Ride(
+        Ride.model_construct(
             journey_departure="2025-03-02T08:43:00Z",
             journey_arrival="2025-03-02T11:59:00Z",
             location_from="Leipzig",
             location_to="Frankfurt",
             is_template=True,
         ),
-    ]
+    )
 
 
 def test_list(api_config_read):
@@ -52,9 +64,12 @@ def test_create(api_config_dict, sample_rides):
     assert rides[0].is_template == sample_rides[0].is_template
 
 
-def test_list_paginated(api_config_dict, sample_rides):
-    for _ in range(20):
-        _ = routes_ride_post(sample_rides[0], api_config_dict["read_write"])
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("async_client")
+async def test_list_paginated(api_config_dict, sample_rides):
+    _ = await asyncio.gather(
+        *(routes_ride_post_async(sample_rides[0], api_config_dict["read_write"]) for _ in range(20))
+    )
 
     rides = routes_ride_list(page=0, size=5, api_config_override=api_config_dict["read"])
     assert len(rides) == 5
@@ -100,24 +115,26 @@ def test_update(api_config_dict, sample_rides):
     assert rides[0].is_template == sample_rides[1].is_template
 
 
-def test_delete(api_config_dict, sample_rides):
-    created_ride = routes_ride_post(sample_rides[0], api_config_dict["read_write"])
-    assert created_ride.id == 1
-    created_ride = routes_ride_post(sample_rides[1], api_config_dict["read_write"])
-    assert created_ride.id == 2
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("async_client")
+async def test_delete(api_config_dict, sample_rides):
+    # Both rides are created concurrently, so the server may hand out the IDs in either order
+    deleted_ride, kept_ride = await asyncio.gather(
+        routes_ride_post_async(sample_rides[0], api_config_dict["read_write"]),
+        routes_ride_post_async(sample_rides[1], api_config_dict["read_write"]),
+    )
+    assert sorted([deleted_ride.id, kept_ride.id]) == [1, 2]
 
-    routes_ride_delete(1, api_config_dict["read_write"])
+    routes_ride_delete(deleted_ride.id, api_config_dict["read_write"])
 
-    with pytest.raises(HTTPException) as exc:
-        routes_ride_get(1, api_config_dict["read"])
-    assert exc.value.status_code == 404
+    assert_http_status(404, routes_ride_get, deleted_ride.id, api_config_dict["read"])
 
-    _ = routes_ride_get(2, api_config_dict["read"])
+    _ = routes_ride_get(kept_ride.id, api_config_dict["read"])
 
     rides = routes_ride_list(api_config_override=api_config_dict["read"])
     assert len(rides) == 1
 
-    assert rides[0].id == 2
+    assert rides[0].id == kept_ride.id
     assert rides[0].journey_departure == sample_rides[1].journey_departure
     assert rides[0].journey_arrival == sample_rides[1].journey_arrival
     assert rides[0].location_from == sample_rides[1].location_from
@@ -125,52 +142,31 @@ def test_delete(api_config_dict, sample_rides):
     assert rides[0].is_template == sample_rides[1].is_template
 
 
-def test_list_unauthorized(api_config_unauthorized):
-    with pytest.raises(HTTPException) as exc:
-        routes_ride_list(api_config_override=api_config_unauthorized)
-    assert exc.value.status_code == 401
-
-
-def test_read_unauthorized(api_config_unauthorized):
-    with pytest.raises(HTTPException) as exc:
-        routes_ride_get(1, api_config_unauthorized)
-    assert exc.value.status_code == 401
-
-
-def test_create_unauthorized(api_config_unauthorized, sample_rides):
-    with pytest.raises(HTTPException) as exc:
-        routes_ride_post(sample_rides[0], api_config_unauthorized)
-    assert exc.value.status_code == 401
-
-
-def test_update_unauthorized(api_config_unauthorized, sample_rides):
-    with pytest.raises(HTTPException) as exc:
-        routes_ride_put(1, sample_rides[0], api_config_unauthorized)
-    assert exc.value.status_code == 401
-
-
-def test_delete_unauthorized(api_config_unauthorized):
-    with pytest.raises(HTTPException) as exc:
-        routes_ride_delete(1, api_config_unauthorized)
-    assert exc.value.status_code == 401
-
-
-def test_create_no_rights(api_config_read, sample_rides):
-    with pytest.raises(HTTPException) as exc:
-        routes_ride_post(sample_rides[0], api_config_read)
-    assert exc.value.status_code == 401
-
-
-def test_update_no_rights(api_config_read, sample_rides):
-    with pytest.raises(HTTPException) as exc:
-        routes_ride_put(1, sample_rides[0], api_config_read)
-    assert exc.value.status_code == 401
-
-
-def test_delete_no_rights(api_config_read):
-    with pytest.raises(HTTPException) as exc:
-        routes_ride_delete(1, api_config_read)
-    assert exc.value.status_code == 401
+# The auth guards answer 401 before any lookup, so the 401 tests use fixed IDs that need not exist.
+@pytest.mark.parametrize(
+    "call",
+    [
+        pytest.param(lambda config, ride: routes_ride_list(api_config_override=config), id="list"),
+        pytest.param(lambda config, ride: routes_ride_get(1, config), id="read"),
+        pytest.param(lambda config, ride: routes_ride_post(ride, config), id="create"),
+        pytest.param(lambda config, ride: routes_ride_put(1, ride, config), id="update"),
+        pytest.param(lambda config, ride: routes_ride_delete(1, config), id="delete"),
+    ],
+)
+def test_unauthorized(call, api_config_unauthorized, sample_rides):
+    assert_http_status(401, call, api_config_unauthorized, sample_rides[0])
+
+
+@pytest.mark.parametrize(
+    "call",
+    [
+        pytest.param(lambda config, ride: routes_ride_post(ride, config), id="create"),
+        pytest.param(lambda config, ride: routes_ride_put(1, ride, config), id="update"),
+        pytest.param(lambda config, ride: routes_ride_delete(1, config), id="delete"),
+    ],
+)
+def test_no_rights(call, api_config_read, sample_rides):
+    assert_http_status(401, call, api_config_read, sample_rides[0])
 
 
 @pytest.fixture
@@ -179,19 +175,13 @@ def wrong_owner(api_config_dict, sample_rides):
     return api_config_dict["read_write_2"]
 
 
-def test_read_wrong_owner(wrong_owner):
-    with pytest.raises(HTTPException) as exc:
-        routes_ride_get(1, wrong_owner)
-    assert exc.value.status_code == 404
-
-
-def test_update_wrong_owner(wrong_owner, sample_rides):
-    with pytest.raises(HTTPException) as exc:
-        routes_ride_put(1, sample_rides[0], wrong_owner)
-    assert exc.value.status_code == 404
-
-
-def test_delete_wrong_owner(wrong_owner):
-    with pytest.raises(HTTPException) as exc:
-        routes_ride_delete(1, wrong_owner)
-    assert exc.value.status_code == 404
+@pytest.mark.parametrize(
+    "call",
+    [
+        pytest.param(lambda config, ride: routes_ride_get(1, config), id="read"),
+        pytest.param(lambda config, ride: routes_ride_put(1, ride, config), id="update"),
+        pytest.param(lambda config, ride: routes_ride_delete(1, config), id="delete"),
+    ],
+)
+def test_wrong_owner(call, wrong_owner, sample_rides):
+    assert_http_status(404, call, wrong_owner, sample_rides[0])
@@ -5,81 +5,115 @@
 # file, You can obtain one at https://mozilla.org/MPL/2.0/.
 
 import pytest
+from types import SimpleNamespace
 
-from client.services.Ride_service import *
-from client.services.Tag_service import *
-from server_fixtures import *
+from client.models.Ride import Ride
+from client.models.RideTagLink import RideTagLink
+from client.models.Tag import Tag
+from client.models.Value import Value
+from client.services.Ride_service import (
+    routes_ride_post,
+    routes_ride_tag_delete,
+    routes_ride_tag_get_by_link_id,
+    routes_ride_tag_get_by_tag_id,
+    routes_ride_tag_list,
+    routes_ride_tag_post_by_tag_id,
+    routes_ride_tag_put,
+)
+from client.services.Tag_service import routes_tag_post
+from server_fixtures import MISSING_ID, assert_http_status
 
 
-@pytest.fixture
-def post_ride(api_config_dict):
+pytestmark = pytest.mark.xdist_group(name="test_ride_tag")
+
+
+def create_ride(api_config):
     created_ride = routes_ride_post(
-        Ride(
+        Ride.model_construct(
             journey_departure="2025-03-01T15:15:00Z",
             location_from="Berlin",
             location_to="Hamburg",
             is_template=False,
         ),
-        api_config_dict["read_write"],
+        api_config,
     )
     return created_ride
 
 
-@pytest.fixture
-def post_tags(api_config_dict):
+def create_tags(api_config):
     created_tags = []
     for tag in [
-        Tag(
+        Tag.model_construct(
             tag_type="integer",
             tag_key="int_tag",
             tag_name="Integer Tag",
         ),
-        Tag(
+        Tag.model_construct(
             tag_type="float",
             tag_key="float_tag",
         ),
-        Tag(
+        Tag.model_construct(
             tag_type="string",
             tag_key="str_tag",
         ),
-        Tag(
+        Tag.model_construct(
             tag_type="date_time",
             tag_key="dt_tag",
         ),
     ]:
-        created_tags.append(routes_tag_post(tag, api_config_dict["read_write"]))
+        created_tags.append(routes_tag_post(tag, api_config))
     return created_tags
 
 
-class X(Value):
-    type: str
-    value: Any
+def scalars(value):
+    """Fields of a Value as a tuple, so that a failing comparison names the field that differs."""
+    return value.type, value.value
 
 
 @pytest.fixture
+def post_ride(api_config_dict):
+    return create_ride(api_config_dict["read_write"])
+
+
+@pytest.fixture
+def post_tags(api_config_dict):
+    return create_tags(api_config_dict["read_write"])
+
+
+@pytest.fixture(scope="module")
 def sample_links():
-    return [
-        RideTagLink(
+    return (
+        RideTagLink.model_construct(
             order=1,
-            value=Value(type="Integer", value=1),#1,
+            value=Value.model_construct(type="Integer", value=1),#1,
         ),
-        RideTagLink(
+        RideTagLink.model_construct(
             order=2,
-            value=Value(type="Integer", value=2),#2,
+            value=Value.model_construct(type="Integer", value=2),#2,
         ),
-        RideTagLink(
+        RideTagLink.model_construct(
             order=2,
-            value=Value(type="Float", value=2.0),#2.0,
+            value=Value.model_construct(type="Float", value=2.0),#2.0,
         ),
-        RideTagLink(
+        RideTagLink.model_construct(
             order=3,
-            value=Value(type="String", value="3"),#"3",
+            value=Value.model_construct(type="String", value="3"),#"3",
         ),
-        RideTagLink(
+        RideTagLink.model_construct(
             order=4,
-            value=Value(type="DateTime", value="2025-05-18T22:17:00Z"),#"2025-05-18T22:17:00Z",
+            value=Value.model_construct(type="DateTime", value="2025-05-18T22:17:00Z"),#"2025-05-18T22:17:00Z",
         ),
-    ]
+    )
+
+
+@pytest.fixture
+def ride_with_first_link(api_config_dict, sample_links):
+    """One ride, the tags and a link of sample_links[0] to the first tag."""
+    ride = create_ride(api_config_dict["read_write"])
+    tags = create_tags(api_config_dict["read_write"])
+    link = routes_ride_tag_post_by_tag_id(ride.id, tags[0].id, sample_links[0], api_config_dict["read_write"])
+    assert link.id == 1
+    return ride, tags
 
 
 def test_list(post_ride, api_config_read):
@@ -91,7 +125,7 @@ def test_create(api_config_dict, post_ride, post_tags, sample_links):
     created_link = routes_ride_tag_post_by_tag_id(post_ride.id, post_tags[0].id, sample_links[0], api_config_dict["read_write"])
     assert created_link.id == 1
     assert created_link.order == sample_links[0].order
-    assert created_link.value == sample_links[0].value
+    assert scalars(created_link.value) == scalars(sample_links[0].value)
     assert created_link.ride_id == post_ride.id
     assert created_link.tag_id == post_tags[0].id
 
@@ -99,37 +133,31 @@ def test_create(api_config_dict, post_ride, post_tags, sample_links):
     assert len(links) == 1
 
     assert links[0].link.order == sample_links[0].order
-    assert links[0].link.value == sample_links[0].value
+    assert scalars(links[0].link.value) == scalars(sample_links[0].value)
     assert links[0].link.ride_id == post_ride.id
     assert links[0].link.tag_id == post_tags[0].id
 
 
-def test_read(api_config_dict, post_ride, post_tags, sample_links):
-    created_link = routes_ride_tag_post_by_tag_id(post_ride.id, post_tags[0].id, sample_links[0], api_config_dict["read_write"])
-    assert created_link.id == 1
-    assert created_link.order == sample_links[0].order
-    assert created_link.value == sample_links[0].value
-    assert created_link.ride_id == post_ride.id
-    assert created_link.tag_id == post_tags[0].id
+def test_read(api_config_dict, ride_with_first_link, sample_links):
+    post_ride, post_tags = ride_with_first_link
 
     read_link = routes_ride_tag_get_by_tag_id(post_ride.id, post_tags[0].id, api_config_dict["read"])
     assert read_link.link.id == 1
     assert read_link.link.order == sample_links[0].order
-    assert read_link.link.value == sample_links[0].value
+    assert scalars(read_link.link.value) == scalars(sample_links[0].value)
     assert read_link.link.ride_id == post_ride.id
     assert read_link.link.tag_id == post_tags[0].id
 
     read_link = routes_ride_tag_get_by_link_id(1, api_config_dict["read"])
     assert read_link.link.id == 1
     assert read_link.link.order == sample_links[0].order
-    assert read_link.link.value == sample_links[0].value
+    assert scalars(read_link.link.value) == scalars(sample_links[0].value)
     assert read_link.link.ride_id == post_ride.id
     assert read_link.link.tag_id == post_tags[0].id
 
 
-def test_update(api_config_dict, post_ride, post_tags, sample_links):
-    created_link = routes_ride_tag_post_by_tag_id(post_ride.id, post_tags[0].id, sample_links[0], api_config_dict["read_write"])
-    assert created_link.id == 1
+def test_update(api_config_dict, ride_with_first_link, sample_links):
+    post_ride, post_tags = ride_with_first_link
 
     routes_ride_tag_put(1, sample_links[1], api_config_dict["read_write"])
 
@@ -137,24 +165,21 @@ def test_update(api_config_dict, post_ride, post_tags, sample_links):
     assert len(links) == 1
 
     assert links[0].link.order == sample_links[1].order
-    assert links[0].link.value == sample_links[1].value
+    assert scalars(links[0].link.value) == scalars(sample_links[1].value)
     assert links[0].link.ride_id == post_ride.id
     assert links[0].link.tag_id == post_tags[0].id
 
 
-def test_delete(api_config_dict, post_ride, post_tags, sample_links):
-    created_link = routes_ride_tag_post_by_tag_id(post_ride.id, post_tags[0].id, sample_links[0],
-                                                  api_config_dict["read_write"])
-    assert created_link.id == 1
+def test_delete(api_config_dict, ride_with_first_link, sample_links):
+    post_ride, post_tags = ride_with_first_link
+
     created_link = routes_ride_tag_post_by_tag_id(post_ride.id, post_tags[1].id, sample_links[3],
                                                   api_config_dict["read_write"])
     assert created_link.id == 2
 
     routes_ride_tag_delete(1, api_config_dict["read_write"])
 
-    with pytest.raises(HTTPException) as exc:
-        routes_ride_tag_get_by_link_id(1, api_config_dict["read"])
-    assert exc.value.status_code == 404
+    assert_http_status(404, routes_ride_tag_get_by_link_id, 1, api_config_dict["read"])
 
     _ = routes_ride_tag_get_by_link_id(2, api_config_dict["read"])
 
@@ -162,117 +187,77 @@ def test_delete(api_config_dict, post_ride, post_tags, sample_links):
     assert len(links) == 1
 
     assert links[0].link.order == sample_links[3].order
-    assert links[0].link.value == sample_links[3].value
+    assert scalars(links[0].link.value) == scalars(sample_links[3].value)
     assert links[0].link.ride_id == post_ride.id
     assert links[0].link.tag_id == post_tags[1].id
 
 #####################################################################
 
-def test_list_unauthorized(post_ride, api_config_unauthorized):
-    with pytest.raises(HTTPException) as exc:
-        routes_ride_tag_list(post_ride.id, api_config_unauthorized)
-    assert exc.value.status_code == 401
-
-
-def test_read_unauthorized(api_config_unauthorized):
-    with pytest.raises(HTTPException) as exc:
-        routes_ride_tag_get_by_link_id(1, api_config_unauthorized)
-    assert exc.value.status_code == 401
-    with pytest.raises(HTTPException) as exc:
-        routes_ride_tag_get_by_tag_id(1, 1, api_config_unauthorized)
-    assert exc.value.status_code == 401
-
-
-def test_create_unauthorized(api_config_unauthorized, post_ride, post_tags, sample_links):
-    with pytest.raises(HTTPException) as exc:
-        routes_ride_tag_post_by_tag_id(post_ride.id, post_tags[0].id, sample_links[0], api_config_unauthorized)
-    assert exc.value.status_code == 401
-
-
-def test_update_unauthorized(api_config_unauthorized, sample_links):
-    with pytest.raises(HTTPException) as exc:
-        routes_ride_tag_put(1, sample_links[0], api_config_unauthorized)
-    assert exc.value.status_code == 401
-
-
-def test_delete_unauthorized(api_config_unauthorized):
-    with pytest.raises(HTTPException) as exc:
-        routes_ride_tag_delete(1, api_config_unauthorized)
-    assert exc.value.status_code == 401
+# The auth guards answer 401 before any lookup, so the 401 tests use fixed IDs that need not exist.
+@pytest.mark.parametrize(
+    "call",
+    [
+        pytest.param(lambda config, link: routes_ride_tag_list(1, config), id="list"),
+        pytest.param(lambda config, link: routes_ride_tag_get_by_link_id(1, config), id="read_by_link_id"),
+        pytest.param(lambda config, link: routes_ride_tag_get_by_tag_id(1, 1, config), id="read_by_tag_id"),
+        pytest.param(lambda config, link: routes_ride_tag_post_by_tag_id(1, 1, link, config), id="create"),
+        pytest.param(lambda config, link: routes_ride_tag_put(1, link, config), id="update"),
+        pytest.param(lambda config, link: routes_ride_tag_delete(1, config), id="delete"),
+    ],
+)
+def test_unauthorized(call, api_config_unauthorized, sample_links):
+    assert_http_status(401, call, api_config_unauthorized, sample_links[0])
 
 #####################################################################
 
-def test_create_no_rights(api_config_read, post_ride, post_tags, sample_links):
-    with pytest.raises(HTTPException) as exc:
-        routes_ride_tag_post_by_tag_id(post_ride.id, post_tags[0].id, sample_links[0], api_config_read)
-    assert exc.value.status_code == 401
-
-
-def test_update_no_rights(api_config_read, sample_links):
-    with pytest.raises(HTTPException) as exc:
-        routes_ride_tag_put(1, sample_links[0], api_config_read)
-    assert exc.value.status_code == 401
-
-
-def test_delete_no_rights(api_config_read):
-    with pytest.raises(HTTPException) as exc:
-        routes_ride_tag_delete(1, api_config_read)
-    assert exc.value.status_code == 401
+@pytest.mark.parametrize(
+    "call",
+    [
+        pytest.param(lambda config, link: routes_ride_tag_post_by_tag_id(1, 1, link, config), id="create"),
+        pytest.param(lambda config, link: routes_ride_tag_put(1, link, config), id="update"),
+        pytest.param(lambda config, link: routes_ride_tag_delete(1, config), id="delete"),
+    ],
+)
+def test_no_rights(call, api_config_read, sample_links):
+    assert_http_status(401, call, api_config_read, sample_links[0])
 
 #####################################################################
 
 @pytest.fixture
-def wrong_owner(api_config_dict, post_ride, post_tags, sample_links):
-    link = routes_ride_tag_post_by_tag_id(post_ride.id, post_tags[0].id, sample_links[0], api_config_dict["read_write"])
-    assert link.id == 1
+def wrong_owner(api_config_dict, ride_with_first_link):
     return api_config_dict["read_write_2"]
 
 
-def test_read_wrong_owner(wrong_owner):
-    with pytest.raises(HTTPException) as exc:
-        routes_ride_tag_get_by_link_id(1, wrong_owner)
-    assert exc.value.status_code == 404
-
-
-def test_update_wrong_owner(wrong_owner, sample_links):
-    with pytest.raises(HTTPException) as exc:
-        routes_ride_tag_put(1, sample_links[0], wrong_owner)
-    assert exc.value.status_code == 404
-
-
-def test_delete_wrong_owner(wrong_owner):
-    with pytest.raises(HTTPException) as exc:
-        routes_ride_tag_delete(1, wrong_owner)
-    assert exc.value.status_code == 404
+@pytest.mark.parametrize(
+    "call",
+    [
+        pytest.param(lambda config, link: routes_ride_tag_get_by_link_id(1, config), id="read"),
+        pytest.param(lambda config, link: routes_ride_tag_put(1, link, config), id="update"),
+        pytest.param(lambda config, link: routes_ride_tag_delete(1, config), id="delete"),
+    ],
+)
+def test_wrong_owner(call, wrong_owner, sample_links):
+    assert_http_status(404, call, wrong_owner, sample_links[0])
 
 #####################################################################
 
 @pytest.fixture
-def no_ride(api_config_dict, post_ride, post_tags):
-    routes_ride_delete(post_ride.id, api_config_dict["read_write"])
-    return post_ride
+def no_ride():
+    return SimpleNamespace(id=MISSING_ID)
 
 
 def test_list_no_ride(no_ride, api_config_read):
-    with pytest.raises(HTTPException) as exc:
-        routes_ride_tag_list(no_ride.id, api_config_read)
-    assert exc.value.status_code == 404
+    assert_http_status(404, routes_ride_tag_list, no_ride.id, api_config_read)
 
 
 def test_create_no_ride(no_ride, post_tags, sample_links, api_config_dict):
-    with pytest.raises(HTTPException) as exc:
-        routes_ride_tag_post_by_tag_id(no_ride.id, post_tags[0].id, sample_links[0], api_config_dict["read_write"])
-    assert exc.value.status_code == 404
+    assert_http_status(404, routes_ride_tag_post_by_tag_id, no_ride.id, post_tags[0].id, sample_links[0], api_config_dict["read_write"])
 
 #####################################################################
 
 def test_list_wrong_ride_owner(post_ride, api_config_dict):
-    with pytest.raises(HTTPException) as exc:
-        routes_ride_tag_list(post_ride.id, api_config_dict["read_2"])
-    assert exc.value.status_code == 404
+    assert_http_status(404, routes_ride_tag_list, post_ride.id, api_config_dict["read_2"])
 
 
 def test_create_wrong_ride_owner(post_ride, post_tags, sample_links, api_config_dict):
-    with pytest.raises(HTTPException) as exc:
-        routes_ride_tag_post_by_tag_id(post_ride.id, post_tags[0].id, sample_links[0], api_config_dict["read_write_2"])
-    assert exc.value.status_code == 404
+    assert_http_status(404, routes_ride_tag_post_by_tag_id, post_ride.id, post_tags[0].id, sample_links[0], api_config_dict["read_write_2"])
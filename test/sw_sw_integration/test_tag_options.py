@@ -5,15 +5,28 @@
 # file, You can obtain one at https://mozilla.org/MPL/2.0/.
 
 import pytest
+from types import SimpleNamespace
 
-from client.services.Tag_service import *
-from server_fixtures import *
+from client.models.Tag import Tag
+from client.models.TagOption import TagOption
+from client.services.Tag_service import (
+    routes_tag_option_delete,
+    routes_tag_option_get,
+    routes_tag_option_list,
+    routes_tag_option_post,
+    routes_tag_option_put,
+    routes_tag_post,
+)
+from server_fixtures import MISSING_ID, assert_http_status
+
+
+pytestmark = pytest.mark.xdist_group(name="test_tag_options")
 
 
 @pytest.fixture
 def post_tag(api_config_dict):
     created_tag = routes_tag_post(
-        Tag(
+        Tag.model_construct(
             tag_type="enum",
             tag_key="enum_tag",
         ),
@@ -22,23 +35,23 @@ def post_tag(api_config_dict):
     return created_tag
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_options():
-    return [
-        TagOption(
+    return (
+        TagOption.model_construct(
             order=1,
             value="Option 1",
         ),
-        TagOption(
+        TagOption.model_construct(
             order=2,
             value="Option 2",
             name="opt2",
         ),
-        TagOption(
+        TagOption.model_construct(
             order=3,
             value="Option 3",
         ),
-    ]
+    )
 
 
 def test_list(post_tag, api_config_read):
@@ -100,9 +113,7 @@ def test_delete(api_config_dict, post_tag, sample_options):
 
     routes_tag_option_delete(1, api_config_dict["read_write"])
 
-    with pytest.raises(HTTPException) as exc:
-        routes_tag_option_get(1, api_config_dict["read"])
-    assert exc.value.status_code == 404
+    assert_http_status(404, routes_tag_option_get, 1, api_config_dict["read"])
 
     _ = routes_tag_option_get(2, api_config_dict["read"])
 
@@ -117,53 +128,32 @@ def test_delete(api_config_dict, post_tag, sample_options):
 
 #####################################################################
 
-def test_list_unauthorized(post_tag, api_config_unauthorized):
-    with pytest.raises(HTTPException) as exc:
-        routes_tag_option_list(post_tag.id, api_config_unauthorized)
-    assert exc.value.status_code == 401
-
-
-def test_read_unauthorized(api_config_unauthorized):
-    with pytest.raises(HTTPException) as exc:
-        routes_tag_option_get(1, api_config_unauthorized)
-    assert exc.value.status_code == 401
-
-
-def test_create_unauthorized(api_config_unauthorized, post_tag, sample_options):
-    with pytest.raises(HTTPException) as exc:
-        routes_tag_option_post(post_tag.id, sample_options[0], api_config_unauthorized)
-    assert exc.value.status_code == 401
-
-
-def test_update_unauthorized(api_config_unauthorized, sample_options):
-    with pytest.raises(HTTPException) as exc:
-        routes_tag_option_put(1, sample_options[0], api_config_unauthorized)
-    assert exc.value.status_code == 401
-
-
-def test_delete_unauthorized(api_config_unauthorized):
-    with pytest.raises(HTTPException) as exc:
-        routes_tag_option_delete(1, api_config_unauthorized)
-    assert exc.value.status_code == 401
+# The auth guards answer 401 before any lookup, so the 401 tests use fixed IDs that need not exist.
+@pytest.mark.parametrize(
+    "call",
+    [
+        pytest.param(lambda config, option: routes_tag_option_list(1, config), id="list"),
+        pytest.param(lambda config, option: routes_tag_option_get(1, config), id="read"),
+        pytest.param(lambda config, option: routes_tag_option_post(1, option, config), id="create"),
+        pytest.param(lambda config, option: routes_tag_option_put(1, option, config), id="update"),
+        pytest.param(lambda config, option: routes_tag_option_delete(1, config), id="delete"),
+    ],
+)
+def test_unauthorized(call, api_config_unauthorized, sample_options):
+    assert_http_status(401, call, api_config_unauthorized, sample_options[0])
 
 #####################################################################
 
-def test_create_no_rights(api_config_read, post_tag, sample_options):
-    with pytest.raises(HTTPException) as exc:
-        routes_tag_option_post(post_tag.id, sample_options[0], api_config_read)
-    assert exc.value.status_code == 401
-
-
-def test_update_no_rights(api_config_read, sample_options):
-    with pytest.raises(HTTPException) as exc:
-        routes_tag_option_put(1, sample_options[0], api_config_read)
-    assert exc.value.status_code == 401
-
-
-def test_delete_no_rights(api_config_read):
-    with pytest.raises(HTTPException) as exc:
-        routes_tag_option_delete(1, api_config_read)
-    assert exc.value.status_code == 401
+@pytest.mark.parametrize(
+    "call",
+    [
+        pytest.param(lambda config, option: routes_tag_option_post(1, option, config), id="create"),
+        pytest.param(lambda config, option: routes_tag_option_put(1, option, config), id="update"),
+        pytest.param(lambda config, option: routes_tag_option_delete(1, config), id="delete"),
+    ],
+)
+def test_no_rights(call, api_config_read, sample_options):
+    assert_http_status(401, call, api_config_read, sample_options[0])
 
 #####################################################################
 
@@ -173,51 +163,36 @@ def wrong_owner(api_config_dict, post_tag, sample_options):
     return api_config_dict["read_write_2"]
 
 
-def test_read_wrong_owner(wrong_owner):
-    with pytest.raises(HTTPException) as exc:
-        routes_tag_option_get(1, wrong_owner)
-    assert exc.value.status_code == 404
-
-
-def test_update_wrong_owner(wrong_owner, sample_options):
-    with pytest.raises(HTTPException) as exc:
-        routes_tag_option_put(1, sample_options[0], wrong_owner)
-    assert exc.value.status_code == 404
-
-
-def test_delete_wrong_owner(wrong_owner):
-    with pytest.raises(HTTPException) as exc:
-        routes_tag_option_delete(1, wrong_owner)
-    assert exc.value.status_code == 404
+@pytest.mark.parametrize(
+    "call",
+    [
+        pytest.param(lambda config, option: routes_tag_option_get(1, config), id="read"),
+        pytest.param(lambda config, option: routes_tag_option_put(1, option, config), id="update"),
+        pytest.param(lambda config, option: routes_tag_option_delete(1, config), id="delete"),
+    ],
+)
+def test_wrong_owner(call, wrong_owner, sample_options):
+    assert_http_status(404, call, wrong_owner, sample_options[0])
 
 #####################################################################
 
 @pytest.fixture
-def no_tag(api_config_dict, post_tag, sample_options):
-    routes_tag_delete(post_tag.id, api_config_dict["read_write"])
-    return post_tag
+def no_tag():
+    return SimpleNamespace(id=MISSING_ID)
 
 
 def test_list_no_tag(no_tag, api_config_read):
-    with pytest.raises(HTTPException) as exc:
-        routes_tag_option_list(no_tag.id, api_config_read)
-    assert exc.value.status_code == 404
+    assert_http_status(404, routes_tag_option_list, no_tag.id, api_config_read)
 
 
 def test_create_no_tag(no_tag, sample_options, api_config_dict):
-    with pytest.raises(HTTPException) as exc:
-        routes_tag_option_post(no_tag.id, sample_options[0], api_config_dict["read_write"])
-    assert exc.value.status_code == 404
+    assert_http_status(404, routes_tag_option_post, no_tag.id, sample_options[0], api_config_dict["read_write"])
 
 #####################################################################
 
 def test_list_wrong_tag_owner(post_tag, api_config_dict):
-    with pytest.raises(HTTPException) as exc:
-        routes_tag_option_list(post_tag.id, api_config_dict["read_2"])
-    assert exc.value.status_code == 404
+    assert_http_status(404, routes_tag_option_list, post_tag.id, api_config_dict["read_2"])
 
 
 def test_create_wrong_tag_owner(post_tag, sample_options, api_config_dict):
-    with pytest.raises(HTTPException) as exc:
-        routes_tag_option_post(post_tag.id, sample_options[0], api_config_dict["read_write_2"])
-    assert exc.value.status_code == 404
+    assert_http_status(404, routes_tag_option_post, post_tag.id, sample_options[0], api_config_dict["read_write_2"])
@@ -6,39 +6,53 @@
 
 import pytest
 
-from client.services.Tag_service import *
-from server_fixtures import *
+from client.models.Tag import Tag
+from client.services.Tag_service import (
+    routes_tag_delete,
+    routes_tag_get,
+    routes_tag_list,
+    routes_tag_post,
+    routes_tag_put,
+)
+from server_fixtures import assert_http_status
 
 
-@pytest.fixture
-def sample_tags():
-    return [
-        Tag(
+pytestmark = pytest.mark.xdist_group(name="test_tags")
+
+
+@pytest.fixture(scope="module")
+def valid_sample_tags():
+    return (
+        Tag.model_construct(
             tag_type="integer",
             tag_key="int_tag",
             tag_name="Integer Tag",
         ),
-        Tag(
+        Tag.model_construct(
             tag_type="float",
             tag_key="float_tag",
         ),
-        Tag(
+        Tag.model_construct(
             tag_type="string",
             tag_key="str_tag",
         ),
-        Tag(
+        Tag.model_construct(
             tag_type="date_time",
             tag_key="dt_tag",
         ),
-        Tag(
+        Tag.model_construct(
             tag_type="enum",
             tag_key="enum_tag",
         ),
-        Tag(
-            tag_type="asdf",
-            tag_key="invalid_tag",
-        ),
-    ]
+    )
+
+
+@pytest.fixture(scope="module")
+def invalid_sample_tag():
+    return Tag.model_construct(
+        tag_type="asdf",
+        tag_key="invalid_tag",
+    )
 
 
 def test_list(api_config_read):
@@ -46,67 +60,65 @@ def test_list(api_config_read):
     assert len(rides) == 0
 
 
-def test_create(api_config_dict, sample_tags):
-    created_tag = routes_tag_post(sample_tags[0], api_config_dict["read_write"])
+def test_create(api_config_dict, valid_sample_tags):
+    created_tag = routes_tag_post(valid_sample_tags[0], api_config_dict["read_write"])
     assert created_tag.id == 1
-    assert created_tag.tag_type == sample_tags[0].tag_type
-    assert created_tag.tag_key == sample_tags[0].tag_key
-    assert created_tag.tag_name == sample_tags[0].tag_name
-    assert created_tag.tag_display_name == sample_tags[0].tag_name
+    assert created_tag.tag_type == valid_sample_tags[0].tag_type
+    assert created_tag.tag_key == valid_sample_tags[0].tag_key
+    assert created_tag.tag_name == valid_sample_tags[0].tag_name
+    assert created_tag.tag_display_name == valid_sample_tags[0].tag_name
 
     tags = routes_tag_list(api_config_dict["read"])
     assert len(tags) == 1
 
     assert tags[0].id == 1
-    assert tags[0].tag_type == sample_tags[0].tag_type
-    assert tags[0].tag_key == sample_tags[0].tag_key
-    assert tags[0].tag_name == sample_tags[0].tag_name
-    assert tags[0].tag_display_name == sample_tags[0].tag_name
+    assert tags[0].tag_type == valid_sample_tags[0].tag_type
+    assert tags[0].tag_key == valid_sample_tags[0].tag_key
+    assert tags[0].tag_name == valid_sample_tags[0].tag_name
+    assert tags[0].tag_display_name == valid_sample_tags[0].tag_name
 
 
-def test_read(api_config_dict, sample_tags):
-    created_tag = routes_tag_post(sample_tags[0], api_config_dict["read_write"])
+def test_read(api_config_dict, valid_sample_tags):
+    created_tag = routes_tag_post(valid_sample_tags[0], api_config_dict["read_write"])
     assert created_tag.id == 1
-    assert created_tag.tag_type == sample_tags[0].tag_type
-    assert created_tag.tag_key == sample_tags[0].tag_key
-    assert created_tag.tag_name == sample_tags[0].tag_name
-    assert created_tag.tag_display_name == sample_tags[0].tag_name
+    assert created_tag.tag_type == valid_sample_tags[0].tag_type
+    assert created_tag.tag_key == valid_sample_tags[0].tag_key
+    assert created_tag.tag_name == valid_sample_tags[0].tag_name
+    assert created_tag.tag_display_name == valid_sample_tags[0].tag_name
 
     read_tag = routes_tag_get(1, api_config_dict["read"])
     assert read_tag.id == 1
-    assert read_tag.tag_type == sample_tags[0].tag_type
-    assert read_tag.tag_key == sample_tags[0].tag_key
-    assert read_tag.tag_name == sample_tags[0].tag_name
-    assert read_tag.tag_display_name == sample_tags[0].tag_name
+    assert read_tag.tag_type == valid_sample_tags[0].tag_type
+    assert read_tag.tag_key == valid_sample_tags[0].tag_key
+    assert read_tag.tag_name == valid_sample_tags[0].tag_name
+    assert read_tag.tag_display_name == valid_sample_tags[0].tag_name
 
 
-def test_update(api_config_dict, sample_tags):
-    created_tag = routes_tag_post(sample_tags[0], api_config_dict["read_write"])
+def test_update(api_config_dict, valid_sample_tags):
+    created_tag = routes_tag_post(valid_sample_tags[0], api_config_dict["read_write"])
     assert created_tag.id == 1
 
-    routes_tag_put(1, sample_tags[1], api_config_dict["read_write"])
+    routes_tag_put(1, valid_sample_tags[1], api_config_dict["read_write"])
 
     tags = routes_tag_list(api_config_dict["read"])
     assert len(tags) == 1
 
     assert tags[0].id == 1
-    assert tags[0].tag_type == sample_tags[1].tag_type
-    assert tags[0].tag_key == sample_tags[1].tag_key
-    assert tags[0].tag_name == sample_tags[1].tag_name
-    assert tags[0].tag_display_name == sample_tags[1].tag_key
+    assert tags[0].tag_type == valid_sample_tags[1].tag_type
+    assert tags[0].tag_key == valid_sample_tags[1].tag_key
+    assert tags[0].tag_name == valid_sample_tags[1].tag_name
+    assert tags[0].tag_display_name == valid_sample_tags[1].tag_key
 
 
-def test_delete(api_config_dict, sample_tags):
-    created_tag = routes_tag_post(sample_tags[0], api_config_dict["read_write"])
+def test_delete(api_config_dict, valid_sample_tags):
+    created_tag = routes_tag_post(valid_sample_tags[0], api_config_dict["read_write"])
     assert created_tag.id == 1
-    created_tag = routes_tag_post(sample_tags[1], api_config_dict["read_write"])
+    created_tag = routes_tag_post(valid_sample_tags[1], api_config_dict["read_write"])
     assert created_tag.id == 2
 
     routes_tag_delete(1, api_config_dict["read_write"])
 
-    with pytest.raises(HTTPException) as exc:
-        routes_tag_get(1, api_config_dict["read"])
-    assert exc.value.status_code == 404
+    assert_http_status(404, routes_tag_get, 1, api_config_dict["read"])
 
     _ = routes_tag_get(2, api_config_dict["read"])
 
@@ -114,89 +126,60 @@ def test_delete(api_config_dict, sample_tags):
     assert len(tags) == 1
 
     assert tags[0].id == 2
-    assert tags[0].tag_type == sample_tags[1].tag_type
-    assert tags[0].tag_key == sample_tags[1].tag_key
-    assert tags[0].tag_name == sample_tags[1].tag_name
-    assert tags[0].tag_display_name == sample_tags[1].tag_key
+    assert tags[0].tag_type == valid_sample_tags[1].tag_type
+    assert tags[0].tag_key == valid_sample_tags[1].tag_key
+    assert tags[0].tag_name == valid_sample_tags[1].tag_name
+    assert tags[0].tag_display_name == valid_sample_tags[1].tag_key
 
 #####################################################################
 
-def test_list_unauthorized(api_config_unauthorized):
-    with pytest.raises(HTTPException) as exc:
-        routes_tag_list(api_config_unauthorized)
-    assert exc.value.status_code == 401
-
-
-def test_read_unauthorized(api_config_unauthorized):
-    with pytest.raises(HTTPException) as exc:
-        routes_tag_get(1, api_config_unauthorized)
-    assert exc.value.status_code == 401
-
-
-def test_create_unauthorized(api_config_unauthorized, sample_tags):
-    with pytest.raises(HTTPException) as exc:
-        routes_tag_post(sample_tags[0], api_config_unauthorized)
-    assert exc.value.status_code == 401
-
-
-def test_update_unauthorized(api_config_unauthorized, sample_tags):
-    with pytest.raises(HTTPException) as exc:
-        routes_tag_put(1, sample_tags[0], api_config_unauthorized)
-    assert exc.value.status_code == 401
-
-
-def test_delete_unauthorized(api_config_unauthorized):
-    with pytest.raises(HTTPException) as exc:
-        routes_tag_delete(1, api_config_unauthorized)
-    assert exc.value.status_code == 401
+# The auth guards answer 401 before any lookup, so the 401 tests use fixed IDs that need not exist.
+@pytest.mark.parametrize(
+    "call",
+    [
+        pytest.param(lambda config, tag: routes_tag_list(config), id="list"),
+        pytest.param(lambda config, tag: routes_tag_get(1, config), id="read"),
+        pytest.param(lambda config, tag: routes_tag_post(tag, config), id="create"),
+        pytest.param(lambda config, tag: routes_tag_put(1, tag, config), id="update"),
+        pytest.param(lambda config, tag: routes_tag_delete(1, config), id="delete"),
+    ],
+)
+def test_unauthorized(call, api_config_unauthorized, valid_sample_tags):
+    assert_http_status(401, call, api_config_unauthorized, valid_sample_tags[0])
 
 #####################################################################
 
-def test_create_no_rights(api_config_read, sample_tags):
-    with pytest.raises(HTTPException) as exc:
-        routes_tag_post(sample_tags[0], api_config_read)
-    assert exc.value.status_code == 401
-
-
-def test_update_no_rights(api_config_read, sample_tags):
-    with pytest.raises(HTTPException) as exc:
-        routes_tag_put(1, sample_tags[0], api_config_read)
-    assert exc.value.status_code == 401
-
-
-def test_delete_no_rights(api_config_read):
-    with pytest.raises(HTTPException) as exc:
-        routes_tag_delete(1, api_config_read)
-    assert exc.value.status_code == 401
+@pytest.mark.parametrize(
+    "call",
+    [
+        pytest.param(lambda config, tag: routes_tag_post(tag, config), id="create"),
+        pytest.param(lambda config, tag: routes_tag_put(1, tag, config), id="update"),
+        pytest.param(lambda config, tag: routes_tag_delete(1, config), id="delete"),
+    ],
+)
+def test_no_rights(call, api_config_read, valid_sample_tags):
+    assert_http_status(401, call, api_config_read, valid_sample_tags[0])
 
 #####################################################################
 
 @pytest.fixture
-def wrong_owner(api_config_dict, sample_tags):
-    _ = routes_tag_post(sample_tags[0], api_config_dict["read_write"])
+def wrong_owner(api_config_dict, valid_sample_tags):
+    _ = routes_tag_post(valid_sample_tags[0], api_config_dict["read_write"])
     return api_config_dict["read_write_2"]
 
 
-def test_read_wrong_owner(wrong_owner):
-    with pytest.raises(HTTPException) as exc:
-        routes_tag_get(1, wrong_owner)
-    assert exc.value.status_code == 404
-
-
-def test_update_wrong_owner(wrong_owner, sample_tags):
-    with pytest.raises(HTTPException) as exc:
-        routes_tag_put(1, sample_tags[0], wrong_owner)
-    assert exc.value.status_code == 404
-
-
-def test_delete_wrong_owner(wrong_owner):
-    with pytest.raises(HTTPException) as exc:
-        routes_tag_delete(1, wrong_owner)
-    assert exc.value.status_code == 404
+@pytest.mark.parametrize(
+    "call",
+    [
+        pytest.param(lambda config, tag: routes_tag_get(1, config), id="read"),
+        pytest.param(lambda config, tag: routes_tag_put(1, tag, config), id="update"),
+        pytest.param(lambda config, tag: routes_tag_delete(1, config), id="delete"),
+    ],
+)
+def test_wrong_owner(call, wrong_owner, valid_sample_tags):
+    assert_http_status(404, call, wrong_owner, valid_sample_tags[0])
 
 #####################################################################
 
-def test_create_invalid_tag(api_config_dict, sample_tags):
-    with pytest.raises(HTTPException) as exc:
-        routes_tag_post(sample_tags[5], api_config_dict["read_write"])
-    assert exc.value.status_code == 400
+def test_create_invalid_tag(api_config_dict, invalid_sample_tag):
+    assert_http_status(400, routes_tag_post, invalid_sample_tag, api_config_dict["read_write"])
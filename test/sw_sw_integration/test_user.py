@@ -0,0 +1,70 @@
+# SPDX-License-Identifier: MPL-2.0
+#   Copyright (c) 2025 Philipp Le <philipp@philipple.de>.
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+import pytest
+
+from client.models.User import User
+from client.services.User_service import routes_user_get, routes_user_put
+from client.services.async_User_service import (
+    routes_user_get as routes_user_get_async,
+    routes_user_put as routes_user_put_async,
+)
+from server_fixtures import ROLES, assert_http_status
+
+
+pytestmark = pytest.mark.xdist_group(name="test_user")
+
+
+# The user table is never cleaned, so each test sets the name it reads back.
+def test_read(api_config_read):
+    user = routes_user_get(api_config_read)
+    assert user.id is not None
+    assert user.jwt_issuer == "local"
+    assert user.jwt_subject == ROLES["read"][0]
+    assert user.model_fields_set == set(User.model_fields)
+
+
+def test_update(api_config_dict):
+    updated_user = routes_user_put(User.model_construct(name="Test User"), api_config_dict["read_write"])
+    assert updated_user.name == "Test User"
+    assert updated_user.jwt_subject == ROLES["read_write"][0]
+
+    read_user = routes_user_get(api_config_dict["read"])
+    assert read_user.id == updated_user.id
+    assert read_user.name == "Test User"
+
+    other_user = routes_user_get(api_config_dict["read_2"])
+    assert other_user.id != updated_user.id
+    assert other_user.jwt_subject == ROLES["read_2"][0]
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("async_client")
+async def test_update_async(api_config_dict):
+    updated_user = await routes_user_put_async(User.model_construct(name="Async User"), api_config_dict["read_write_2"])
+    assert updated_user.name == "Async User"
+
+    read_user = await routes_user_get_async(api_config_dict["read_2"])
+    assert read_user.id == updated_user.id
+    assert read_user.name == "Async User"
+    assert read_user.model_fields_set == set(User.model_fields)
+
+#####################################################################
+
+@pytest.mark.parametrize(
+    "call",
+    [
+        pytest.param(lambda config, user: routes_user_get(config), id="read"),
+        pytest.param(lambda config, user: routes_user_put(user, config), id="update"),
+    ],
+)
+def test_unauthorized(call, api_config_unauthorized):
+    assert_http_status(401, call, api_config_unauthorized, User.model_construct(name="Test User"))
+
+#####################################################################
+
+def test_no_rights(api_config_read):
+    assert_http_status(401, routes_user_put, User.model_construct(name="Test User"), api_config_read)